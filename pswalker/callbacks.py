@@ -5,6 +5,7 @@ Specialized Callbacks for Skywalker
 # Standard #
 ############
 import logging
+from collections import deque
 
 ###############
 # Third Party #
@@ -21,6 +22,10 @@ from .utils.argutils import isiterable
 
 logger = logging.getLogger(__name__)
 
+# Types seen in event documents that can be classified without isiterable
+_ARRAY_TYPES = (np.ndarray, list, tuple)
+_SCALAR_TYPES = (str, int, float, np.generic)
+
 
 def apply_filters(doc, filters=None, drop_missing=True):
     """
@@ -52,36 +57,44 @@ def apply_filters(doc, filters=None, drop_missing=True):
         apply_filters(doc, filters = {'a' : lambda x : x > 0,
                                       'c' : lambda x : 4 < x < 6})
     """
-    resp = []
     filters = filters or dict()
-    # Iterate through filters
+    # Iterate through filters, stopping at the first rejection
     for key, func in filters.items():
         try:
-
-            # Check iterables for nan and inf
-            if isiterable(doc[key]):
-                if any(np.isnan(doc[key])) or any(np.isinf(doc[key])):
-                    resp.append(not drop_missing)
+            value = doc[key]
+
+            # Check iterables for nan and inf. Common array types are checked
+            # directly, only unfamiliar types fall back to the ABC check
+            if isinstance(value, _ARRAY_TYPES) or (
+                not isinstance(value, _SCALAR_TYPES) and isiterable(value)
+            ):
+                if any(np.isnan(value)) or any(np.isinf(value)):
+                    if drop_missing:
+                        return False
                     continue
 
             # Check string entries for nan and inf
-            elif isinstance(doc[key], str):
-                if "inf" == doc[key].lower() or "nan" == doc[key].lower():
-                    resp.append(not drop_missing)
+            elif isinstance(value, str):
+                if "inf" == value.lower() or "nan" == value.lower():
+                    if drop_missing:
+                        return False
                     continue
 
             # Handle all other types
             else:
-                if np.isnan(doc[key]) or np.isinf(doc[key]):
-                    resp.append(not drop_missing)
+                if np.isnan(value) or np.isinf(value):
+                    if drop_missing:
+                        return False
                     continue
 
             # Evaluate filter
-            resp.append(bool(func(doc[key])))
+            if not func(value):
+                return False
 
         # Handle missing information
         except KeyError:
-            resp.append(not drop_missing)
+            if drop_missing:
+                return False
 
         # Handle improper filter
         except Exception as e:
@@ -90,8 +103,8 @@ def apply_filters(doc, filters=None, drop_missing=True):
                 'reported exception "{}"'
                 "".format(key, e)
             )
-    # Summarize
-    return all(resp)
+    # Every filter passed
+    return True
 
 
 def rank_models(models, target, **kwargs):
@@ -114,6 +127,29 @@ def rank_models(models, target, **kwargs):
     model_ranking : list
         List of models sorted by accuracy of predictions
     """
+    # Predict with every model at once if they all have a cached fit
+    if models and all(
+        getattr(model, "_batch_eval", False) and model._fast_coeffs
+        for model in models
+    ):
+        try:
+            coeffs = np.array([model._fast_coeffs for model in models], dtype=float)
+            features = np.array(
+                [model._features(**kwargs) for model in models], dtype=float
+            )
+        # Mixed model types or array inputs, evaluate one by one instead
+        except ValueError:
+            pass
+        else:
+            estimates = np.sum(coeffs * features, axis=1)
+            logger.debug(
+                "Models %s predicted values of %s",
+                [model.name for model in models],
+                estimates,
+            )
+            diffs = np.abs(estimates - target)
+            return [models[i] for i in np.argsort(diffs)]
+
     # Initialize values
     model_ranking = np.asarray(models)
     diffs = list()
@@ -124,13 +160,11 @@ def rank_models(models, target, **kwargs):
         try:
             estimate = model.eval(**kwargs)
             diffs.append(np.abs(estimate - target))
-            logger.debug(
-                "Model {} predicted a value of {}" "".format(model.name, estimate)
-            )
+            logger.debug("Model %s predicted a value of %s", model.name, estimate)
         except RuntimeError as e:
             bad_models.append(model)
             diffs.append(np.inf)
-            logger.debug("Unable to yield estimate from model {}" "".format(model.name))
+            logger.debug("Unable to yield estimate from model %s", model.name)
             logger.debug(e)
     # Rank performances
     model_ranking = model_ranking[np.argsort(diffs)]
@@ -161,6 +195,13 @@ class LiveBuild(LiveFit):
         update on every new event
     """
 
+    # Names of the fit parameters cached by :meth:`.update_fit`
+    _coeff_names = ()
+    # Whether eval is the product of _features and the cached fit, so that
+    # rank_models can batch the prediction. Subclasses that reimplement eval
+    # differently should set this to False
+    _batch_eval = False
+
     def __init__(
         self,
         model,
@@ -179,7 +220,38 @@ class LiveBuild(LiveFit):
         self.average = average
         self.filters = filters or {}
         self.drop_missing = drop_missing
-        self._avg_cache = list()
+
+    def _reset(self):
+        super()._reset()
+        self._fast_coeffs = None
+
+    def update_fit(self):
+        """
+        Update the fit and cache the resulting parameter values so that
+        subclasses can evaluate the model without going through lmfit
+        """
+        super().update_fit()
+        if self.result:
+            self._fast_coeffs = tuple(
+                self.result.values[name] for name in self._coeff_names
+            )
+
+    @property
+    def average(self):
+        """
+        Number of events averaged together before being added to the fit.
+        Changing it keeps the events waiting to be averaged, dropping the
+        oldest ones if there are more than the new setting
+        """
+        return self._avg_cache.maxlen
+
+    @average.setter
+    def average(self, value):
+        if value < 1 or value != int(value):
+            raise ValueError(
+                "Average must be a positive whole number, not {}".format(value)
+            )
+        self._avg_cache = deque(getattr(self, "_avg_cache", ()), maxlen=int(value))
 
     @property
     def name(self):
@@ -217,7 +289,7 @@ class LiveBuild(LiveFit):
         self._avg_cache.append(doc)
 
         # Check we have the right number of shots to average
-        if len(self._avg_cache) >= self.average:
+        if len(self._avg_cache) == self.average:
             # Overwrite event number
             # This can be removed with an update to Bluesky Issue #684
             doc["seq_num"] = len(self.ydata) + 1
@@ -235,14 +307,27 @@ class LiveBuild(LiveFit):
         Reimplemented by subclasses
         """
         logger.debug(
-            "Evaluating model {} with args : {}, kwargs {}"
-            "".format(self.name, args, kwargs)
+            "Evaluating model %s with args : %s, kwargs %s", self.name, args, kwargs
         )
         if not self.result:
             raise RuntimeError(
                 "Can not evaluate without a saved fit, " "use .update_fit()"
             )
 
+    def _features(self, **kwargs):
+        """
+        Values to multiply with the cached fit parameters to form a prediction.
+        Reimplemented by subclasses
+        """
+        return ()
+
+    def _predict(self, **kwargs):
+        """
+        Prediction from :meth:`._features` and the cached fit parameters
+        """
+        features = self._features(**kwargs)
+        return sum(c * np.asarray(f) for (c, f) in zip(self._fast_coeffs, features))
+
     def backsolve(self, target, **kwargs):
         """
         Use the most recent fit to find the independent variables that create
@@ -254,8 +339,10 @@ class LiveBuild(LiveFit):
             variable to solve for, and which to keep fixed
         """
         logger.debug(
-            "Backsolving model {} for target {} and kwargs {}"
-            "".format(self.name, target, kwargs)
+            "Backsolving model %s for target %s and kwargs %s",
+            self.name,
+            target,
+            kwargs,
         )
         if not self.result:
             raise RuntimeError(
@@ -290,6 +377,9 @@ class LinearFit(LiveBuild):
         update on every new event
     """
 
+    _coeff_names = ("slope", "intercept")
+    _batch_eval = True
+
     def __init__(self, y, x, init_guess=None, update_every=1, name=None, average=1):
         # Create model
         model = LinearModel(missing="drop", name=name)
@@ -331,18 +421,12 @@ class LinearFit(LiveBuild):
         # Check result
         super().eval(**kwargs)
 
-        # Standard x setup
-        if kwargs.get("x"):
-            x = kwargs["x"]
-
-        elif self.independent_vars["x"] in kwargs.keys():
-            x = kwargs[self.independent_vars["x"]]
+        # Use the cached fit parameters if available
+        if self._fast_coeffs:
+            return self._predict(**kwargs)
 
-        else:
-            raise ValueError(
-                "Must supply keyword `x` or use fieldname {}"
-                "".format(self.independent_vars["x"])
-            )
+        # Standard x setup
+        x = self._get_x(**kwargs)
 
         # Structure input add past result
         kwargs = {"x": np.asarray(x)}
@@ -351,6 +435,24 @@ class LinearFit(LiveBuild):
         # Return prediction
         return self.result.model.eval(**kwargs)
 
+    def _get_x(self, **kwargs):
+        """
+        Find the independent variable from either ``x`` or the field name
+        """
+        if kwargs.get("x"):
+            return kwargs["x"]
+
+        elif self.independent_vars["x"] in kwargs.keys():
+            return kwargs[self.independent_vars["x"]]
+
+        raise ValueError(
+            "Must supply keyword `x` or use fieldname {}"
+            "".format(self.independent_vars["x"])
+        )
+
+    def _features(self, **kwargs):
+        return (self._get_x(**kwargs), 1.0)
+
     def backsolve(self, target, **kwargs):
         """
         Find the ``x`` position that solves the reaches the given target
@@ -406,6 +508,9 @@ class MultiPitchFit(LiveBuild):
         update on every new event
     """
 
+    _coeff_names = ("x0", "x1", "x2")
+    _batch_eval = True
+
     def __init__(
         self, centroid, alphas, name=None, init_guess=None, update_every=1, average=1
     ):
@@ -433,27 +538,42 @@ class MultiPitchFit(LiveBuild):
             average=average,
         )
 
-    def eval(self, a0=0.0, a1=0.0, **kwargs):
+    def eval(self, a0=0.0, a1=0.0, grid=False, **kwargs):
         """
         Evaluate the predicted outcome based on the most recent fit of
         the given information
 
         Parameters
         ----------
-        a0 : float
+        a0 : float or array
             Pitch of the first mirror
 
-        a1 : float
+        a1 : float or array
             Pitch of the second mirror
 
+        grid : bool, optional
+            If True, ``a0`` and ``a1`` are treated as the axes of a grid of
+            pitches and the prediction is evaluated at every combination.
+            Otherwise they are broadcast against each other element-wise
+
         Returns
         -------
-        centroid : float
-            Position of the centroid as predicted by the current model fit
+        centroid : float or array
+            Position of the centroid as predicted by the current model fit. If
+            ``grid`` is True this has shape ``(len(a0), len(a1))``
         """
         # Check result
         super().eval(a0, a1)
 
+        # Broadcast the pitches across each other
+        if grid:
+            a0 = np.atleast_1d(a0)[:, np.newaxis]
+            a1 = np.atleast_1d(a1)[np.newaxis, :]
+
+        # Use the cached fit parameters if available
+        if self._fast_coeffs:
+            return self._predict(a0=a0, a1=a1)
+
         # Structure input and add past result
         kwargs = {"a0": np.asarray(a0), "a1": np.asarray(a1)}
         kwargs.update(self.result.values)
@@ -461,6 +581,9 @@ class MultiPitchFit(LiveBuild):
         # Return prediction
         return self.result.model.eval(**kwargs)
 
+    def _features(self, a0=0.0, a1=0.0, **kwargs):
+        return (1.0, a0, a1)
+
     def backsolve(self, target, a0=None, a1=None):
         """
         Find the mirror configuration to reach a certain pixel value
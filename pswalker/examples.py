@@ -8,21 +8,19 @@ import logging
 # Standard #
 ############
 from collections.abc import Iterable
-from functools import partial
+from functools import lru_cache, partial
+from types import SimpleNamespace
 
 ###############
 # Third Party #
 ###############
 import numpy as np
 
-from .sim.mirror import OffsetMirror
-##########
-# Module #
-##########
-from .sim.source import Undulator
-
 logger = logging.getLogger(__name__)
 
+# Types isiterable can answer True for without an isinstance check
+_ITERABLE_TYPES = frozenset((list, tuple, set, dict, np.ndarray))
+
 
 class TestBase(object):
     """
@@ -49,7 +47,11 @@ def isiterable(obj):
     bool : bool
         True if the obj is an iterable, False if not.
     """
-    if isinstance(obj, str):
+    # Check the common concrete types before walking the Iterable ABC
+    obj_type = type(obj)
+    if obj_type in _ITERABLE_TYPES:
+        return True
+    elif isinstance(obj, str):
         return False
     else:
         return isinstance(obj, Iterable)
@@ -59,9 +61,12 @@ def one_bounce(a1, x0, xp0, x1, z1, z2):
     """
     Calculates the x position of the beam after bouncing off one flat mirror.
 
+    Any of the inputs can be arrays, in which case they are broadcast against
+    each other and the positions are calculated elementwise.
+
     Parameters
     ----------
-    a1 : float
+    a1 : float or np.ndarray
         Pitch of first mirror in radians
 
     x0 : float
@@ -76,8 +81,13 @@ def one_bounce(a1, x0, xp0, x1, z1, z2):
     z1 : float
         z position of the first mirror in meters
 
-    z2 : float
+    z2 : float or np.ndarray
         z position of the imager
+
+    Returns
+    -------
+    result : float or np.ndarray
+        x position of the beam at the imager in meters
     """
     result = -2 * a1 * z1 + 2 * a1 * z2 - z2 * xp0 + 2 * x1 - x0
     return result
@@ -87,10 +97,15 @@ def two_bounce(alphas, x0, xp0, x1, z1, x2, z2, z3):
     """
     Calculates the x position of the beam after bouncing off two flat mirrors.
 
+    Any of the inputs can be arrays, in which case they are broadcast against
+    each other and the positions are calculated elementwise.
+
     Parameters
     ----------
-    alphas : tuple
-        Tuple of the mirror pitches (a1, a2) in radians
+    alphas : tuple or np.ndarray
+        Tuple of the mirror pitches (a1, a2) in radians. Each pitch can be an
+        array, or alphas can be an array with one row per mirror, e.g. of
+        shape (2, N)
 
     x0 : float
         x position of the source in meters
@@ -110,8 +125,13 @@ def two_bounce(alphas, x0, xp0, x1, z1, x2, z2, z3):
     z2 : float
         z position of the second mirror in meters
 
-    z3 : float
+    z3 : float or np.ndarray
         z position of imager
+
+    Returns
+    -------
+    result : float or np.ndarray
+        x position of the beam at the imager in meters
     """
     result = (
         2 * alphas[0] * z1
@@ -126,13 +146,138 @@ def two_bounce(alphas, x0, xp0, x1, z1, x2, z2, z3):
     return result
 
 
-def _x_to_pixel(x, pim):
+def _x_to_pixel(x, sim_x, half_x, scale_x):
+    """
+    Convert the inputted x position to a pixel on a pim.
+
+    Parameters
+    ----------
+    x : float or np.ndarray
+        The x position to be converted
+
+    sim_x : float or np.ndarray
+        x position of the pim in meters
+
+    half_x : int or np.ndarray
+        Center pixel of the pim image
+
+    scale_x : float or np.ndarray
+        Pixels per meter of the pim image
+
+    Returns
+    -------
+    result : float or np.ndarray
+        Pixel the x position corresponds to on the pim.
+    """
+    result = half_x + (x - sim_x) * scale_x
+    if isinstance(result, np.ndarray):
+        return np.round(result)
+    return round(result, 0)
+
+
+@lru_cache(maxsize=None)
+def _sim_classes():
+    """
+    Simulated device classes used by this module. They are imported on first
+    use so that the ray tracing equations can be used without loading ophyd.
+    """
+    from .sim.mirror import OffsetMirror
+    from .sim.signal import FakeSignal
+    from .sim.source import Undulator
+
+    return SimpleNamespace(
+        FakeSignal=FakeSignal, OffsetMirror=OffsetMirror, Undulator=Undulator
+    )
+
+
+def _is_static(sig):
+    """
+    Whether the readback of the inputted signal only changes when it is put
+    to, i.e. it is a FakeSignal without noise or a custom readback.
+    """
+    FakeSignal = _sim_classes().FakeSignal
+    return (
+        isinstance(sig, FakeSignal)
+        and not sig.noise
+        and "_get_readback" not in vars(sig)
+        and type(sig)._get_readback is FakeSignal._get_readback
+    )
+
+
+def _pim_params(pim):
+    """
+    Get the pim values used by the centroid calculations.
+
+    The values are read once and cached on the pim, then refreshed whenever
+    one of the underlying signals is put to, so the centroid readbacks do not
+    have to read every signal on each call. If any of the signals has noise
+    enabled or a custom readback, the values are read live on every call
+    instead.
+
+    Parameters
+    ----------
+    pim : PIM
+        The simulated PIM object to get the values of
+
+    Returns
+    -------
+    params : SimpleNamespace
+        Namespace with the ``size_x``, ``resolution_x``, ``sim_x`` and
+        ``sim_z`` values of the pim, along with the center pixel ``half_x``
+        and the pixels per meter ``scale_x``
+    """
+    try:
+        params, signals, update = pim._sim_params
+    except AttributeError:
+        params, signals, update = _pim_params_cache(pim)
+        pim._sim_params = (params, signals, update)
+
+    if not all(_is_static(sig) for sig in signals.values()):
+        # Readbacks that change without a put have to be read every time
+        update()
+        params.live = True
+    elif params.live:
+        # Drop the values read while the signals were live
+        update()
+        params.live = False
+    return params
+
+
+def _pim_params_cache(pim):
+    """
+    Create the cached pim values used by _pim_params, subscribing to the
+    underlying signals so the values are refreshed when they are put to.
+    """
+    cam = pim.detector.cam
+    signals = {
+        "size_x": cam.size.size_x,
+        "resolution_x": cam.resolution.resolution_x,
+        "sim_x": pim.sim_x,
+        "sim_z": pim.sim_z,
+    }
+    params = SimpleNamespace(live=False)
+
+    def update(*args, **kwargs):
+        for attr, sig in signals.items():
+            setattr(params, attr, sig.get())
+        # Pixel conversion terms used by the centroid readbacks
+        params.half_x = params.size_x // 2
+        params.scale_x = params.size_x / params.resolution_x
+
+    update()
+    for sig in signals.values():
+        sig.subscribe(update, run=False)
+
+    return params, signals, update
+
+
+def _pim_x_to_pixel(x, pim):
     """
     Convert the inputted x position to a pixel on the inputted pim.
 
     Parameters
     ----------
-    x : float
+    x : float or np.ndarray
         The x position to be converted
 
     pim : PIM
@@ -140,17 +285,11 @@ def _x_to_pixel(x, pim):
 
     Returns
     -------
-    result : int
+    result : float or np.ndarray
         Pixel the x position corresponds to on the inputted pim.
     """
-    cam = pim.detector.cam
-    result = np.round(
-        np.floor(cam.size.size_x.get() / 2)
-        + (x - pim.sim_x.get())
-        * cam.size.size_x.get()
-        / cam.resolution.resolution_x.get()
-    )
-    return result
+    params = _pim_params(pim)
+    return _x_to_pixel(x, params.sim_x, params.half_x, params.scale_x)
 
 
 def _calc_cent_x(source, pim):
@@ -171,9 +310,9 @@ def _calc_cent_x(source, pim):
     result : int
         Pixel of the centroid of the beam at the pim
     """
-    x = source.sim_x.get() + source.sim_xp.get() * pim.sim_z.get()
-    result = _x_to_pixel(x, pim)
-    return result
+    p = _pim_params(pim)
+    x = source.sim_x.get() + source.sim_xp.get() * p.sim_z
+    return _x_to_pixel(x, p.sim_x, p.half_x, p.scale_x)
 
 
 def _m1_calc_cent_x(source, mirror, pim):
@@ -197,16 +336,16 @@ def _m1_calc_cent_x(source, mirror, pim):
     result : int
         Pixel of the centroid of the beam at the pim
     """
+    p = _pim_params(pim)
     x = one_bounce(
         mirror.sim_alpha.get() * 1e-6,
         source.sim_x.get(),
         source.sim_xp.get(),
         mirror.sim_x.get(),
         mirror.sim_z.get(),
-        pim.sim_z.get(),
+        p.sim_z,
     )
-    result = _x_to_pixel(x, pim)
-    return result
+    return _x_to_pixel(x, p.sim_x, p.half_x, p.scale_x)
 
 
 def _m1_m2_calc_cent_x(source, mirror_1, mirror_2, pim):
@@ -233,6 +372,7 @@ def _m1_m2_calc_cent_x(source, mirror_1, mirror_2, pim):
     result : int
         Pixel of the centroid of the beam at the pim
     """
+    p = _pim_params(pim)
     x = two_bounce(
         (mirror_1.sim_alpha.get() * 1e-6, mirror_2.sim_alpha.get() * 1e-6),
         source.sim_x.get(),
@@ -241,24 +381,215 @@ def _m1_m2_calc_cent_x(source, mirror_1, mirror_2, pim):
         mirror_1.sim_z.get(),
         mirror_2.sim_x.get(),
         mirror_2.sim_z.get(),
-        pim.sim_z.get(),
+        p.sim_z,
+    )
+    return _x_to_pixel(x, p.sim_x, p.half_x, p.scale_x)
+
+
+def _order_mirrors(mirrors):
+    """
+    Orders the inputted mirrors along the beamline by their z positions.
+
+    Parameters
+    ----------
+    mirrors : list
+        Simulated mirrors in any order
+
+    Returns
+    -------
+    mirrors : list
+        The mirrors sorted by z, keeping the inputted order for equal z
+    """
+    mirror_zs = [mirror.sim_z.get() for mirror in mirrors]
+    return [mirrors[i] for i in np.argsort(mirror_zs, kind="stable")]
+
+
+def _bounce_counts(mirrors, z):
+    """
+    Counts the mirrors upstream of each inputted z position, using the first
+    two mirrors. A position level with a mirror counts as upstream of it.
+
+    Parameters
+    ----------
+    mirrors : list
+        Simulated mirrors sorted by z
+
+    z : array-like
+        z positions to classify in meters
+
+    Returns
+    -------
+    bounces : np.ndarray
+        Number of reflections, 0 to 2, before each z position
+    """
+    mirror_zs = np.array([mirror.sim_z.get() for mirror in mirrors[:2]])
+    return np.searchsorted(mirror_zs, z, side="left")
+
+
+def calc_cent_x_all(source, mirrors, pims):
+    """
+    Calculates the position of the beam in pixels at every inputted pim in one
+    vectorized pass, picking the no, one or two bounce equation for each pim
+    according to its position relative to the mirrors.
+
+    Parameters
+    ----------
+    source : Undulator
+        The object simulating the source of the beam
+
+    mirrors : list
+        Simulated mirrors to calculate reflections off
+
+    pims : list
+        Simulated PIM objects to convert on
+
+    Returns
+    -------
+    result : np.ndarray
+        Pixel of the centroid of the beam at each pim
+    """
+    # Stack the cached values of the pims into one array per value
+    params = [_pim_params(pim) for pim in pims]
+    table = np.array(
+        [(p.sim_z, p.sim_x, p.half_x, p.scale_x) for p in params], dtype=float
+    )
+    z, sim_x, half_x, scale_x = table.reshape(-1, 4).T
+
+    mirrors = _order_mirrors(mirrors)
+    bounces = _bounce_counts(mirrors, z)
+
+    x0, xp0 = source.sim_x.get(), source.sim_xp.get()
+    x = x0 + xp0 * z
+    if len(mirrors) > 0:
+        m1 = mirrors[0]
+        a1, x1, z1 = m1.sim_alpha.get() * 1e-6, m1.sim_x.get(), m1.sim_z.get()
+        x = np.where(bounces == 1, one_bounce(a1, x0, xp0, x1, z1, z), x)
+    if len(mirrors) > 1:
+        m2 = mirrors[1]
+        a2, x2, z2 = m2.sim_alpha.get() * 1e-6, m2.sim_x.get(), m2.sim_z.get()
+        x = np.where(
+            bounces == 2, two_bounce((a1, a2), x0, xp0, x1, z1, x2, z2, z), x
+        )
+    return _x_to_pixel(x, sim_x, half_x, scale_x)
+
+
+def sweep_cent_x(source, mirror, pim, alphas):
+    """
+    Calculates the position of the beam in pixels at the inputted pim for each
+    of the inputted pitches of a single mirror, without moving the mirror.
+
+    Parameters
+    ----------
+    source : Undulator
+        The object simulating the source of the beam
+
+    mirror : OffsetMirror
+        The simulated mirror to calculate the reflection with
+
+    pim : PIM
+        The simulated PIM object after the mirror to convert on
+
+    alphas : array-like
+        Pitches of the mirror in microradians
+
+    Returns
+    -------
+    result : np.ndarray
+        Pixel of the centroid of the beam at the pim for each pitch
+    """
+    x = one_bounce(
+        np.asarray(alphas, dtype=float) * 1e-6,
+        source.sim_x.get(),
+        source.sim_xp.get(),
+        mirror.sim_x.get(),
+        mirror.sim_z.get(),
+        _pim_params(pim).sim_z,
+    )
+    return _pim_x_to_pixel(x, pim)
+
+
+def sweep_cent_x_grid(source, mirror_1, mirror_2, pim, alphas_1, alphas_2):
+    """
+    Calculates the position of the beam in pixels at the inputted pim for
+    every combination of the inputted pitches of two mirrors, without moving
+    the mirrors.
+
+    Parameters
+    ----------
+    source : Undulator
+        The object simulating the source of the beam
+
+    mirror_1 : OffsetMirror
+        The simulated mirror to calculate the first reflection with
+
+    mirror_2 : OffsetMirror
+        The simulated mirror to calculate the second reflection with
+
+    pim : PIM
+        The simulated PIM object after both mirrors to convert on
+
+    alphas_1 : array-like
+        Pitches of the first mirror in microradians
+
+    alphas_2 : array-like
+        Pitches of the second mirror in microradians
+
+    Returns
+    -------
+    result : np.ndarray
+        Pixel of the centroid of the beam at the pim, with shape
+        (len(alphas_1), len(alphas_2))
+    """
+    a1 = np.atleast_1d(np.asarray(alphas_1, dtype=float))[:, np.newaxis] * 1e-6
+    a2 = np.atleast_1d(np.asarray(alphas_2, dtype=float))[np.newaxis, :] * 1e-6
+    x = two_bounce(
+        (a1, a2),
+        source.sim_x.get(),
+        source.sim_xp.get(),
+        mirror_1.sim_x.get(),
+        mirror_1.sim_z.get(),
+        mirror_2.sim_x.get(),
+        mirror_2.sim_z.get(),
+        _pim_params(pim).sim_z,
     )
-    return _x_to_pixel(x, pim)
+    return _pim_x_to_pixel(x, pim)
+
+
+# Names and centroid equations indexed by the number of upstream mirrors
+_BOUNCE_NAMES = ("no", "one", "two")
+_BOUNCE_FUNCS = (_calc_cent_x, _m1_calc_cent_x, _m1_m2_calc_cent_x)
 
 
-def patch_pims(
-    pims,
-    mirrors=OffsetMirror("TEST_MIRROR", "TEST_XY", name="test_mirror"),
-    source=Undulator("TEST_UND", name="test_und"),
-):
+@lru_cache(maxsize=None)
+def _default_mirror():
+    """
+    Shared mirror used by patch_pims when no mirrors are inputted.
+    """
+    return _sim_classes().OffsetMirror("TEST_MIRROR", "TEST_XY", name="test_mirror")
+
+
+@lru_cache(maxsize=None)
+def _default_source():
+    """
+    Shared source used by patch_pims when no source is inputted.
+    """
+    return _sim_classes().Undulator("TEST_UND", name="test_und")
+
+
+def patch_pims(pims, mirrors=None, source=None):
     """
     Takes the inputted set of pims and mirrors and then the internal centroid
     calculating function for the pims to be one of the ray-tracing equations
     according to their position relative to the mirrors
 
-    It does this by looping through each of the pims and comparing the stored z
-    position against the z positions of the mirrors, and then pads the centroid
-    readback accordingly.
+    It does this by ordering the mirrors by z, counting the mirrors upstream of
+    each pim by sorting the pim z positions against those of the first two
+    mirrors, and then patches the centroid readback with the matching equation.
+
+    The pim's position, image size and resolution are cached and refreshed
+    when their signals are put to. While any of those signals has noise
+    enabled or a custom readback, they are read on every centroid read
+    instead.
 
     Parameters
     ----------
@@ -266,10 +597,11 @@ def patch_pims(
         PIMs to patch
 
     mirrors : OffsetMirror or list, optional
-        Mirrors to calculate reflections off
+        Mirrors to calculate reflections off. Defaults to a shared test mirror
 
     source : Undulator, optional
-        Object to function as the source of the beam
+        Object to function as the source of the beam. Defaults to a shared
+        test source
 
     Returns
     -------
@@ -277,50 +609,38 @@ def patch_pims(
         The inputted pim objects but with their centroid readbacks patched with
         the ray tracing functions.
     """
+    # Fall back to the shared test devices
+    if mirrors is None:
+        mirrors = _default_mirror()
+    if source is None:
+        source = _default_source()
+
     # Make sure the inputted mirrors and pims are iterables
     if not isiterable(mirrors):
         mirrors = [mirrors]
     if not isiterable(pims):
         pims = [pims]
 
+    # Work through the mirrors in beamline order
+    mirrors = _order_mirrors(mirrors)
+
+    bounces = _bounce_counts(mirrors, [pim.sim_z.get() for pim in pims])
+
     # Go through each pim
-    for pim in pims:
-        # If the pim is before the first mirror or there arent any mirrors
-        if not mirrors or pim.sim_z.get() <= mirrors[0].sim_z.get():
-            logger.debug("Patching '{0}' with no bounce equation.".format(pim.name))
-            pim.detector._get_readback_centroid_x = partial(_calc_cent_x, source, pim)
-
-        elif mirrors[0].sim_z.get() < pim.sim_z.get():
-            # If there is only one mirror and the pim is after it
-            if len(mirrors) == 1:
-                logger.debug(
-                    "Patching '{0}' with one bounce equation.".format(pim.name)
-                )
-                pim.detector._get_readback_centroid_x = partial(
-                    _m1_calc_cent_x, source, mirrors[0], pim
-                )
-
-            # If the pim is behind the second mirror
-            elif pim.sim_z.get() <= mirrors[1].sim_z.get():
-                logger.debug(
-                    "Patching '{0}' with one bounce equation.".format(pim.name)
-                )
-                pim.detector._get_readback_centroid_x = partial(
-                    _m1_calc_cent_x, source, mirrors[0], pim
-                )
-
-            # If the pim is after the second mirror
-            elif mirrors[1].sim_z.get() < pim.sim_z.get():
-                logger.debug(
-                    "Patching '{0}' with two bounce equation.".format(pim.name)
-                )
-                pim.detector._get_readback_centroid_x = partial(
-                    _m1_m2_calc_cent_x, source, mirrors[0], mirrors[1], pim
-                )
-
-        # Patch the y centroid to always be the center of the image
-        pim.detector._get_readback_centroid_y = lambda: (
-            int(pim.detector.cam.size.size_x.get() / 2)
+    for pim, n_bounce in zip(pims, bounces):
+        logger.debug(
+            "Patching '%s' with %s bounce equation.",
+            pim.name,
+            _BOUNCE_NAMES[n_bounce],
+        )
+        pim.detector._get_readback_centroid_x = partial(
+            _BOUNCE_FUNCS[n_bounce], source, *mirrors[:n_bounce], pim
+        )
+
+        # Patch the y centroid to always be the center of the image, binding
+        # this pim rather than the loop variable
+        pim.detector._get_readback_centroid_y = (
+            lambda pim=pim: _pim_params(pim).half_x
         )
 
     # Return just the pim if there was only one of them
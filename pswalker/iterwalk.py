@@ -286,13 +286,14 @@ def iterwalk(
                     )
                 )
                 logger.debug(
-                    (
-                        "Starting walk from {} to {} on {} using {}"
-                        "".format(pos, goal, detectors[index].name, motors[index].name)
-                    )
+                    "Starting walk from %s to %s on %s using %s",
+                    pos,
+                    goal,
+                    detectors[index].name,
+                    motors[index].name,
                 )
 
-                logger.debug("selected tolerance: {}".format(selected_tol[index]))
+                logger.debug("selected tolerance: %s", selected_tol[index])
 
                 pos, models[index] = yield from walk_to_pixel(
                     detectors[index],
@@ -313,14 +314,12 @@ def iterwalk(
                     try:
                         gradients[index] = models[index].result.values["slope"]
                         logger.debug(
-                            "Found equation of ({}, {}) between "
-                            "linear fit of {} to {}"
-                            "".format(
-                                gradients[index],
-                                models[index].result.values["intercept"],
-                                motors[index].name,
-                                detectors[index].name,
-                            )
+                            "Found equation of (%s, %s) between "
+                            "linear fit of %s to %s",
+                            gradients[index],
+                            models[index].result.values["intercept"],
+                            motors[index].name,
+                            detectors[index].name,
                         )
                     except Exception as e:
                         logger.warning(e)
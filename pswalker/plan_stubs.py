@@ -278,8 +278,8 @@ def slit_scan_area_comp(slits, yag, x_width=1.0, y_width=1.0, samples=1):
     yag_measured_x_width = yag_measurements[field_prepend("xwidth", yag)]
     yag_measured_y_width = yag_measurements[field_prepend("ywidth", yag)]
 
-    logger.debug("Measured x width: {}".format(yag_measured_x_width))
-    logger.debug("Measured y width: {}".format(yag_measured_y_width))
+    logger.debug("Measured x width: %s", yag_measured_x_width)
+    logger.debug("Measured y width: %s", yag_measured_y_width)
 
     # err if image not received or image has 0 width,height
     if yag_measured_x_width <= 0 or yag_measured_y_width <= 0:
@@ -423,9 +423,7 @@ def fiducialize(
     """
     # Repeatedly take fiducials
     while start < max_width:
-        logger.debug(
-            "Measuring fiducial with slit {} at {}" "".format(slits.name, start)
-        )
+        logger.debug("Measuring fiducial with slit %s at %s", slits.name, start)
         fiducial = yield from slit_scan_fiducialize(
             slits,
             yag,
@@ -208,7 +208,7 @@ def walk_to_pixel(
         # Take a quick measurement
 
         def gradient_step():
-            logger.debug("Using gradient of {} for naive step..." "".format(gradient))
+            logger.debug("Using gradient of %s for naive step...", gradient)
             # Take a quick measurement
             avgs = yield from measure_average(
                 [detector, motor] + system,
@@ -224,8 +224,7 @@ def walk_to_pixel(
             # Calculate best step on first guess of line
             next_pos = (target - intercept) / gradient
             logger.debug(
-                "Predicting position using line y = {}*x + {}"
-                "".format(gradient, intercept)
+                "Predicting position using line y = %s*x + %s", gradient, intercept
             )
             # Move to position
             yield from mv(motor, next_pos)
@@ -304,9 +303,11 @@ def measure(
     # Log setup
     logger.debug("Running measure")
     logger.debug(
-        "Arguments passed: detectors: {0}, "
-        "num: {1}, delay: {2}, drop_missing: {3}"
-        "".format([d.name for d in detectors], num, delay, drop_missing)
+        "Arguments passed: detectors: %s, num: %s, delay: %s, drop_missing: %s",
+        [d.name for d in detectors],
+        num,
+        delay,
+        drop_missing,
     )
 
     # If scalable, repeat forever
@@ -419,9 +420,9 @@ def measure(
             raise FilterCountError
     # Report finished
     logger.debug(
-        "Finished taking {} measurements, "
-        "filters removed {} events"
-        "".format(len(data), dropped)
+        "Finished taking %s measurements, filters removed %s events",
+        len(data),
+        dropped,
     )
 
     return data
@@ -538,9 +539,7 @@ def fitwalk(
         )
         # Save current target position
         last_shot = avg.pop(target_field)
-        logger.debug(
-            "Averaged data yielded {} is at {}" "".format(target_field, last_shot)
-        )
+        logger.debug("Averaged data yielded %s is at %s", target_field, last_shot)
 
         # Rank models based on accuracy of fit
         model_ranking = rank_models(models, last_shot, **avg)
@@ -560,13 +559,12 @@ def fitwalk(
     while not np.isclose(last_shot, target, atol=tolerance):
         # Log error
         if not steps:
-            logger.debug(
-                "Initial error before fitwalk is {}" "".format(int(target - last_shot))
-            )
+            logger.debug("Initial error before fitwalk is %d", target - last_shot)
         else:
             logger.debug(
-                "fitwalk is reporting an error {} of after step #{}"
-                "".format(int(target - last_shot), steps)
+                "fitwalk is reporting an error %d of after step #%s",
+                target - last_shot,
+                steps,
             )
         # Break on maximum step count
         if max_steps and steps >= max_steps:
@@ -580,9 +578,7 @@ def fitwalk(
             logger.debug("No model yielded accurate prediction, " "using naive plan")
             yield from naive_step()
         else:
-            logger.debug(
-                "Using model {} to determine next step." "".format(accurate_model.name)
-            )
+            logger.debug("Using model %s to determine next step.", accurate_model.name)
             # Calculate estimate of next step from accurate model
             fixed_motors = dict(
                 (key, averaged_data[key])
@@ -614,15 +610,12 @@ def fitwalk(
                     # Attempt to move
                     try:
                         logger.debug(
-                            "Adjusting motor {} to position {:.1f}"
-                            "".format(motor.name, pos)
+                            "Adjusting motor %s to position %.1f", motor.name, pos
                         )
                         yield from mv(motor, pos)
 
                     except KeyboardInterrupt as e:
-                        logger.debug(
-                            "No motor found to adjust variable {}" "".format(e)
-                        )
+                        logger.debug("No motor found to adjust variable %s", e)
         # Count our steps
         steps += 1
 
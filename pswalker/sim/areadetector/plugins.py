@@ -184,10 +184,10 @@ class StatsPlugin(PluginBase, plugins.StatsPlugin):
         self.noise_kwargs_y = noise_kwargs_y
         # Override the default centroid calculator to always output ints
         self.centroid.x._get_readback = lambda **kwargs: int(
-            np.round(self._get_readback_centroid_x())
+            round(self._get_readback_centroid_x())
         )
         self.centroid.y._get_readback = lambda **kwargs: int(
-            np.round(self._get_readback_centroid_y())
+            round(self._get_readback_centroid_y())
         )
 
     def _get_readback_centroid_x(self, **kwargs):
@@ -199,10 +199,10 @@ class StatsPlugin(PluginBase, plugins.StatsPlugin):
     def _int_noise_func(self, sig):
         if sig.noise_type == "uni":
             sig._check_args_uni()
-            return int(np.round(sig.noise_uni()))
+            return int(round(sig.noise_uni()))
         elif self.noise_type == "norm":
             sig._check_args_norm()
-            return int(np.round(sig.noise_norm()))
+            return int(round(sig.noise_norm()))
         else:
             raise ValueError("Invalid noise type. Must be 'uni' or 'norm'")
 
@@ -302,7 +302,7 @@ class ImagePlugin(PluginBase, plugins.ImagePlugin):
     def __init__(self, prefix, *args, **kwargs):
         super().__init__(prefix, *args, **kwargs)
         # Spoof the different components
-        self.array_data._get_readback = lambda: self._image().flatten()
+        self.array_data._get_readback = lambda: self._image().ravel()
         self.ndimensions._get_readback = lambda: len(self.array_size.get())
         self.array_size.height._get_readback = lambda: self._get_shape()[0]
         self.array_size.width._get_readback = lambda: self._get_shape()[1]
@@ -7,6 +7,24 @@ import time
 import numpy as np
 from ophyd.signal import Signal
 
+# Shared generator for all noise draws
+_rng = np.random.default_rng()
+
+
+def seed(seed=None):
+    """
+    Reseeds the generator used for all FakeSignal noise so that simulated
+    readbacks can be reproduced.
+
+    Parameters
+    ----------
+    seed : int, optional
+        Seed passed to numpy.random.default_rng. None reseeds from fresh
+        entropy
+    """
+    global _rng
+    _rng = np.random.default_rng(seed)
+
 
 class FakeSignal(Signal):
     """
@@ -131,6 +149,10 @@ class FakeSignal(Signal):
     def _readback(self):
         if not self.use_string:
             try:
+                # Skip drawing noise that would be multiplied by zero, but
+                # still return the same float result as with the noise added
+                if not self.noise:
+                    return self._get_readback() + 0.0
                 return self._get_readback() + self._noise_func() * self.noise
             except TypeError:
                 if isinstance(self._get_readback(), str):
@@ -159,21 +181,23 @@ class FakeSignal(Signal):
 
     def noise_uni(self, *args, **kwargs):
         """
-        Wrapper for numpy.random.uniform. See URL below for full documentation:
+        Wrapper for numpy.random.Generator.uniform. See URL below for full
+        documentation:
 
-        https://docs.scipy.org/doc/numpy/reference/generated/numpy.random.uniform.html
+        https://numpy.org/doc/stable/reference/random/generated/numpy.random.Generator.uniform.html
         """
         scale = kwargs.pop("scale", self.noise)
-        return np.random.uniform(*args, **kwargs) * scale
+        return _rng.uniform(*args, **kwargs) * scale
 
     def noise_norm(self, *args, **kwargs):
         """
-        Wrapper for numpy.random.normal. See URL below for full documentation:
+        Wrapper for numpy.random.Generator.normal. See URL below for full
+        documentation:
 
-        https://docs.scipy.org/doc/numpy/reference/generated/numpy.random.normal.html
+        https://numpy.org/doc/stable/reference/random/generated/numpy.random.Generator.normal.html
         """
         scale = kwargs.pop("scale", self.noise)
-        return np.random.normal(*args, **kwargs) * scale
+        return _rng.normal(*args, **kwargs) * scale
 
     def stop(self, *args, **kwargs):
         """
@@ -2,6 +2,7 @@ import logging
 
 import numpy as np
 import pandas as pd
+import pytest
 from bluesky import RunEngine
 from bluesky.plans import outer_product_scan, scan
 from ophyd.sim import SynAxis, SynSignal
@@ -35,6 +36,7 @@ def test_linear_fit():
     # Check we create an accurate estimate
     assert np.allclose(cb.eval(x=10), 52, atol=1e-5)
     assert np.allclose(cb.eval(motor=10), 52, atol=1e-5)
+    assert np.allclose(cb.eval(x=10), cb.result.eval(x=10))
     assert np.allclose(cb.backsolve(52)["x"], 10, atol=1e-5)
 
 
@@ -63,6 +65,15 @@ def test_multi_fit():
 
     # Check we create an accurate estimate
     assert np.allclose(cb.eval(a0=5, a1=10), 55, atol=1e-5)
+    assert np.allclose(cb.eval(a0=5, a1=10), cb.result.eval(a0=5, a1=10))
+
+    # Evaluate a grid of pitches at once
+    grid = cb.eval(a0=[0, 5], a1=[0, 10, 20], grid=True)
+    assert grid.shape == (2, 3)
+    assert np.allclose(grid[1, 1], 55, atol=1e-5)
+    row = cb.eval(a0=5, a1=[0, 10, 20], grid=True)
+    assert row.shape == (1, 3)
+    assert np.allclose(row, grid[1:])
     assert np.allclose(cb.backsolve(55, a1=10)["a0"], 5, atol=1e-5)
     assert np.allclose(cb.backsolve(55, a0=5)["a1"], 10, atol=1e-5)
 
@@ -157,3 +168,72 @@ def test_rank_models():
     assert ranking[0] == fit1
     assert ranking[1] == fit3
     assert ranking[2] == fit2
+
+
+def test_rank_models_drops_unfit_models():
+    RE = RunEngine()
+
+    motor = SynAxis(name="motor")
+    det = SynSignal(
+        name="centroid", func=lambda: 5 * motor.read()["motor"]["value"] + 2
+    )
+    fit = LinearFit("centroid", "motor", update_every=None, name="Fit")
+    RE(scan([det], motor, -1, 1, 50), fit)
+    unfit = LinearFit("centroid", "motor", update_every=None, name="Unfit")
+
+    # Models without a fit are removed from the ranking
+    assert rank_models([unfit, fit], target=22, x=4) == [fit]
+    assert rank_models([fit, fit], target=22, x=4) == [fit, fit]
+
+
+class OffsetFit(LinearFit):
+    """LinearFit whose predictions are shifted outside of the fit"""
+
+    _batch_eval = False
+
+    def eval(self, **kwargs):
+        return super().eval(**kwargs) - 60
+
+
+class PlainFit(LinearFit):
+    """LinearFit subclass that keeps the inherited eval"""
+
+
+def test_rank_models_fast_path_matches_eval():
+    RE = RunEngine()
+    motor = SynAxis(name="motor")
+    fits = list()
+    for cls, slope in ((LinearFit, 5), (OffsetFit, 25), (PlainFit, 12)):
+        det = SynSignal(
+            name="centroid",
+            func=lambda slope=slope: slope * motor.read()["motor"]["value"] + 2,
+        )
+        fit = cls("centroid", "motor", update_every=None, name=cls.__name__)
+        RE(scan([det], motor, -1, 1, 50), fit)
+        fits.append(fit)
+    accurate, offset, plain = fits
+
+    # The overridden eval is used to rank the offset model
+    ranking = rank_models([plain, offset, accurate], target=22, x=4)
+    assert ranking == [accurate, offset, plain]
+    compatible = rank_models([plain, accurate], target=22, x=4)
+    assert compatible == [accurate, plain]
+
+    # Ranking through the lmfit models gives the same order
+    for fit in fits:
+        fit._fast_coeffs = None
+    assert rank_models([plain, offset, accurate], target=22, x=4) == ranking
+    assert rank_models([plain, accurate], target=22, x=4) == compatible
+
+
+def test_live_build_average_setting():
+    fit = LinearFit("centroid", "motor", average=2.0)
+    assert fit.average == 2
+    # Events waiting to be averaged are kept
+    fit._avg_cache.append({"data": {"centroid": 1.0, "motor": 0.0}})
+    fit.average = 3
+    assert fit.average == 3
+    assert len(fit._avg_cache) == 1
+    for value in (0, 1.5):
+        with pytest.raises(ValueError):
+            fit.average = value
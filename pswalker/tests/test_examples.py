@@ -1,10 +1,17 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+###############
+# Third Party #
+###############
+import numpy as np
+
 ##########
 # Module #
 ##########
 from pswalker.examples import (_calc_cent_x, _m1_calc_cent_x,
-                               _m1_m2_calc_cent_x, patch_pims)
+                               _m1_m2_calc_cent_x, _pim_x_to_pixel,
+                               calc_cent_x_all, one_bounce, patch_pims,
+                               sweep_cent_x, sweep_cent_x_grid, two_bounce)
 from pswalker.sim import pim
 
 
@@ -55,3 +62,116 @@ def test_pim_set_and_read(one_bounce_system):
     assert pim.sim_x.get() == set_x
     assert pim.sim_z.get() == set_z
     assert pim.detector.stats2.centroid.x.get() == _m1_calc_cent_x(s, mot, pim)
+
+
+def test_pim_readback_follows_pim_changes(one_bounce_system):
+    s, mot, pim = one_bounce_system
+    cent = pim.detector.stats2.centroid.x.get()
+    # Moving the pim shifts the centroid by the move in pixels
+    pim.sim_x.put(pim.sim_x.get() + 0.001)
+    shift = 0.001 * pim.size[0] / pim.resolution[0]
+    assert abs(cent - pim.detector.stats2.centroid.x.get() - shift) <= 1
+    # Resizing the image moves the center pixel
+    pim.size = (1000, 1000)
+    assert pim.detector.stats2.centroid.x.get() == _m1_calc_cent_x(s, mot, pim)
+    assert abs(pim.detector.stats2.centroid.x.get() - 2 * (cent - shift)) <= 2
+
+
+def test_calc_cent_x_all(simple_two_bounce_system):
+    s, m1, m2 = simple_two_bounce_system
+    pims = [pim.PIM("test_pim", name="pim_{0}".format(z), z=z)
+            for z in (3, 10, 13, 20, 25)]
+    pims = patch_pims(pims, [m1, m2], source=s)
+    expected = [p.detector.stats2.centroid.x.get() for p in pims]
+    assert list(calc_cent_x_all(s, [m1, m2], pims)) == expected
+    assert list(calc_cent_x_all(s, [], pims)) == [_calc_cent_x(s, p)
+                                                  for p in pims]
+
+
+def test_pim_x_to_pixel_array(one_bounce_system):
+    s, mot, pim = one_bounce_system
+    xs = [-0.002, -0.0005, 0, 0.0003, 0.001]
+    assert list(_pim_x_to_pixel(np.array(xs), pim)) == [_pim_x_to_pixel(x, pim)
+                                                        for x in xs]
+
+
+def test_patch_pims_orders_mirrors_by_z(simple_two_bounce_system):
+    s, m1, m2 = simple_two_bounce_system
+    pim_1 = pim.PIM("test_pim", name="pim_1", z=25)
+    pim_1 = patch_pims(pim_1, [m2, m1], source=s)
+    assert pim_1.detector.stats2.centroid.x.get() == _m1_m2_calc_cent_x(
+        s, m1, m2, pim_1
+    )
+    assert calc_cent_x_all(s, [m2, m1], [pim_1])[0] == _m1_m2_calc_cent_x(
+        s, m1, m2, pim_1
+    )
+
+
+def test_sweep_cent_x(one_bounce_system):
+    s, mot, pim = one_bounce_system
+    alphas = [-100, 0, 50, mot.sim_alpha.get(), 250]
+    cents = sweep_cent_x(s, mot, pim, alphas)
+    assert cents[3] == pim.detector.stats2.centroid.x.get()
+    for alpha, cent in zip(alphas, cents):
+        x = one_bounce(alpha * 1e-6, s.sim_x.get(), s.sim_xp.get(),
+                       mot.sim_x.get(), mot.sim_z.get(), pim.sim_z.get())
+        assert cent == _pim_x_to_pixel(x, pim)
+    assert sweep_cent_x(s, mot, pim, alphas[3]) == cents[3]
+
+
+def test_bounce_equations_broadcast():
+    alphas = np.array([[0.0, 0.0], [1e-4, -2e-4], [3e-4, 5e-5]])
+    z = np.array([30.0, 40.0, 50.0])
+    # One row per mirror
+    xs = two_bounce(alphas.T, 0.0, 1e-6, 0.0, 10.0, 0.005, 20.0, z)
+    assert xs.shape == (3,)
+    for x, a, zi in zip(xs, alphas, z):
+        assert x == two_bounce(tuple(a), 0.0, 1e-6, 0.0, 10.0, 0.005, 20.0,
+                               zi)
+    # Tuple of pitch arrays
+    assert list(xs) == list(two_bounce((alphas[:, 0], alphas[:, 1]), 0.0,
+                                       1e-6, 0.0, 10.0, 0.005, 20.0, z))
+    xs = one_bounce(alphas[:, 0], 0.0, 1e-6, 0.0, 10.0, z)
+    for x, a1, zi in zip(xs, alphas[:, 0], z):
+        assert x == one_bounce(a1, 0.0, 1e-6, 0.0, 10.0, zi)
+
+
+def test_patch_pims_y_centroid_per_pim():
+    pim_1 = pim.PIM("test_pim", name="pim_1", z=3, size=(500, 500))
+    pim_2 = pim.PIM("test_pim", name="pim_2", z=5, size=(1000, 1000))
+    pim_1, pim_2 = patch_pims([pim_1, pim_2], mirrors=[])
+    assert pim_1.detector.stats2.centroid.y.get() == 250
+    assert pim_2.detector.stats2.centroid.y.get() == 500
+    pim_1.size = (300, 300)
+    assert pim_1.detector.stats2.centroid.y.get() == 150
+
+
+def test_sweep_cent_x_grid(simple_two_bounce_system):
+    s, m1, m2 = simple_two_bounce_system
+    pim_1 = patch_pims(pim.PIM("test_pim", name="pim_1", z=25), [m1, m2],
+                       source=s)
+    alphas_1 = [-50, 0, 100]
+    alphas_2 = [0, 20]
+    cents = sweep_cent_x_grid(s, m1, m2, pim_1, alphas_1, alphas_2)
+    assert cents.shape == (3, 2)
+    for i, a1 in enumerate(alphas_1):
+        for j, a2 in enumerate(alphas_2):
+            x = two_bounce((a1 * 1e-6, a2 * 1e-6), s.sim_x.get(),
+                           s.sim_xp.get(), m1.sim_x.get(), m1.sim_z.get(),
+                           m2.sim_x.get(), m2.sim_z.get(), pim_1.sim_z.get())
+            assert cents[i, j] == _pim_x_to_pixel(x, pim_1)
+    cent = sweep_cent_x_grid(s, m1, m2, pim_1, alphas_1[2], alphas_2[1])
+    assert cent.shape == (1, 1)
+    assert cent[0, 0] == cents[2, 1]
+
+
+def test_pim_readback_reads_noisy_pim_signals_live(one_bounce_system):
+    s, mot, pim = one_bounce_system
+    pim.sim_x.noise = True
+    cents = {pim.detector.stats2.centroid.x.get() for i in range(10)}
+    assert len(cents) > 1
+    # Back to the cached values once the noise is turned off
+    pim.sim_x.noise = False
+    cent = pim.detector.stats2.centroid.x.get()
+    assert cent == pim.detector.stats2.centroid.x.get()
+    assert cent == _m1_calc_cent_x(s, mot, pim)
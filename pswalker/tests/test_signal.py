@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###############
+# Third Party #
+###############
+import numpy as np
+
+##########
+# Module #
+##########
+from pswalker.sim.areadetector.plugins import ImagePlugin
+from pswalker.sim.signal import FakeSignal, seed
+
+
+def test_fake_signal_noise_free_readback_is_float():
+    sig = FakeSignal(value=3, name="sig")
+    assert sig.get() == 3.0
+    assert isinstance(sig.get(), float)
+    assert sig.describe()["sig"]["dtype"] == "number"
+
+
+def test_fake_signal_noise_is_reproducible_after_seed():
+    sigs = [FakeSignal(value=1, name="norm", noise=True),
+            FakeSignal(value=1, name="uni", noise=True, noise_type="uni"),
+            FakeSignal(value=1, name="sized", noise=True,
+                       noise_kwargs={"size": 3})]
+    seed(0)
+    first = [sig.get() for sig in sigs]
+    seed(0)
+    second = [sig.get() for sig in sigs]
+    for a, b in zip(first, second):
+        assert np.array_equal(a, b)
+
+
+def test_image_plugin_array_data_is_a_copy():
+    plugin = ImagePlugin("TEST:IMAGE:", name="image")
+    frame = np.ones((4, 4), dtype=np.uint8)
+    plugin._image = lambda: frame
+    data = plugin.array_data.get()
+    assert data.dtype == np.float64
+    assert not np.shares_memory(data, frame)
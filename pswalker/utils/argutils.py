@@ -1,11 +1,11 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import logging
-from collections.abc import Iterable
 
 from ophyd import Device, Signal
 
 from .. import examples
+from ..examples import isiterable
 
 logger = logging.getLogger(__name__)
 
@@ -101,24 +101,3 @@ def field_prepend(field, obj):
         field = obj.name
 
     return field
-
-
-def isiterable(obj):
-    """
-    Function that determines if an object is an iterable, not including
-    str.
-
-    Parameters
-    ----------
-    obj : object
-        Object to test if it is an iterable.
-
-    Returns
-    -------
-    bool : bool
-        True if the obj is an iterable, False if not.
-    """
-    if isinstance(obj, str):
-        return False
-    else:
-        return isinstance(obj, Iterable)